@@ -1,8 +1,9 @@
 """This modules provides functions to scrape Pennsylvannia campaign finance data"""
 
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
-from io import BytesIO
 from pathlib import Path
 
 import requests
@@ -10,11 +11,51 @@ import requests
 from utils.constants import BASE_FILEPATH
 
 
+def download_PA_year(year: int, output_directory: Path) -> None:
+    """Downloads and extracts a single year's PA archive
+
+    Args:
+        year: The year of data to download
+        output_directory: directory in which the year's files are saved
+    Modifies:
+        Saves raw files from dos.pa.gov to output_directory / year.
+    """
+    pa_url = "https://www.dos.pa.gov/VotingElections/CandidatesCommittees/CampaignFinance/Resources/Documents/"  # noqa
+    link = f"{pa_url}{year}.zip"
+
+    year_directory = output_directory / str(year)
+    year_directory.mkdir(exist_ok=True, parents=True)
+    # stream the archive to a temporary file on disk in chunks
+    # requests.get uses its own short-lived session, so concurrent calls
+    # from different threads never share one
+    with requests.get(link, timeout=10, stream=True) as response:
+        if response.status_code != HTTPStatus.OK:
+            print(f"Pennsylvania data from {year} returned {response.reason}")
+        with tempfile.TemporaryFile() as archive:
+            for chunk in response.iter_content(chunk_size=1024**2):
+                archive.write(chunk)
+            archive.seek(0)
+            zippedfiles = zipfile.ZipFile(archive)
+            # some years have all contents in a single directory named after
+            # the year by default
+            nested_files = []
+            loose_files = []
+            for zippedfile in zippedfiles.infolist():
+                if zippedfile.filename.startswith(f"{year}/"):
+                    nested_files.append(zippedfile)
+                else:
+                    loose_files.append(zippedfile)
+            zippedfiles.extractall(output_directory, members=nested_files)
+            zippedfiles.extractall(year_directory, members=loose_files)
+
+
 def download_PA_data(
     start_year: int, end_year: int, output_directory: Path = None
 ) -> None:
     """Downloads PA datasets from specified years to a local directory
 
+    Each year is a separate archive, so years are downloaded concurrently.
+
     Args:
         start_year: The first year in the range of desired years to extract data
         end_year: The last year in the range of desired years to extract data.
@@ -28,25 +69,15 @@ def download_PA_data(
 
     else:
         output_directory = Path(output_directory).resolve()
-    pa_url = "https://www.dos.pa.gov/VotingElections/CandidatesCommittees/CampaignFinance/Resources/Documents/"  # noqa
-
-    for year in range(start_year, end_year + 1):
-        link = f"{pa_url}{year}.zip"
-
-        response = requests.get(link, timeout=10)
-        if response.status_code != HTTPStatus.OK:
-            print(f"Pennsylvania data from {year} returned {response.reason}")
 
-        year_directory = output_directory / str(year)
-        year_directory.mkdir(exist_ok=True, parents=True)
-        zippedfiles = zipfile.ZipFile(BytesIO(response.content))
-        for zippedfile in zippedfiles.infolist():
-            # some years have all contents in a single directory named after the
-            # year by default
-            if zippedfile.filename.startswith(f"{year}/"):
-                zippedfiles.extract(zippedfile, output_directory)
-            else:
-                zippedfiles.extract(zippedfile, year_directory)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        downloads = [
+            pool.submit(download_PA_year, year, output_directory)
+            for year in range(start_year, end_year + 1)
+        ]
+        for download in downloads:
+            # re-raise any error from the worker thread
+            download.result()
 
 
 if __name__ == "__main__":
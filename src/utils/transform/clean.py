@@ -98,9 +98,7 @@ class StateTransformer(ABC):
             entity_name_dictionary
         """
         entity["standard_entity_type"] = entity["raw_entity_type"].map(
-            lambda raw_entity_type: self.entity_name_dictionary.get(
-                raw_entity_type, None
-            )
+            self.entity_name_dictionary
         )
         return entity
 
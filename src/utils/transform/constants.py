@@ -138,6 +138,8 @@ MN_INDEPENDENT_EXPENDITURE_MAP = {
     "Vendor State": "state",
 }
 
+MN_DATE_FORMAT = "%m/%d/%Y"
+
 MN_RACE_MAP = {
     "GC": "Governor",
     "AG": "Attorney General",
@@ -334,6 +336,63 @@ PA_EXPENSE_COLS_NAMES_POST2022: list = [
     "PURPOSE",
 ]
 
+PA_CONT_DROP_COLS: frozenset = frozenset(
+    {
+        "ADDRESS_1",
+        "ADDRESS_2",
+        "CITY",
+        "STATE",
+        "ZIPCODE",
+        "OCCUPATION",
+        "E_NAME",
+        "E_ADDRESS_1",
+        "E_ADDRESS_2",
+        "E_CITY",
+        "E_STATE",
+        "E_ZIPCODE",
+        "SECTION",
+        "CYCLE",
+        "CONT_DATE_1",
+        "CONT_AMT_1",
+        "CONT_DATE_2",
+        "CONT_AMT_2",
+        "CONT_DATE_3",
+        "CONT_AMT_3",
+    }
+)
+
+PA_FILER_DROP_COLS: frozenset = frozenset(
+    {
+        "YEAR",
+        "CYCLE",
+        "AMEND",
+        "TERMINATE",
+        "DISTRICT",
+        "ADDRESS_1",
+        "ADDRESS_2",
+        "CITY",
+        "STATE",
+        "ZIPCODE",
+        "COUNTY",
+        "PHONE",
+        "BEGINNING",
+        "MONETARY",
+        "INKIND",
+    }
+)
+
+PA_EXPENSE_DROP_COLS: frozenset = frozenset(
+    {
+        "EXPENSE_CYCLE",
+        "EXPENSE_ADDRESS_1",
+        "EXPENSE_ADDRESS_2",
+        "EXPENSE_CITY",
+        "EXPENSE_STATE",
+        "EXPENSE_ZIPCODE",
+        "EXPENSE_DATE",
+    }
+)
+
 PA_OFFICE_ABBREV_DICT: dict = {
     "GOV": "Governor",
     "LTG": "Lieutenant Gov",
@@ -362,42 +421,47 @@ PA_FILER_ABBREV_DICT: dict = {
     3.0: "Lobbyist",
 }
 
-PA_ORGANIZATION_IDENTIFIERS: list = [
-    "FRIENDS",
-    "CITIZENS",
-    "UNION",
-    "STATE",
-    "TEAM",
-    "PAC",
-    "PA",
-    "GOVT",
-    "WARD",
-    "DEM",
-    "COM",
-    "COMMITTEE",
-    "CORP",
-    "ASSOCIATIONS",
-    "FOR",
-    "FOR THE",
-    "SENATE",
-    "COMMONWEALTH",
-    "ELECT",
-    "POLITICAL ACTION COMMITTEE",
-    "REPUBLICANS",
-    "REPUBLICAN",
-    "DEMOCRAT",
-    "DEMOCRATS",
-    "CORPORATION",
-    "CORP",
-    "COMPANY",
-    "CO",
-    "LIMITED",
-    "LTD",
-    "INC",
-    "INCORPORATED",
-    "LLC",
-    "FUND",
-]
+PA_INDIVIDUAL_TYPES: list = ["Individual", "Candidate", "Lobbyist"]
+
+PA_ORGANIZATION_TYPES: list = ["Committee", "Organization"]
+
+PA_ORGANIZATION_IDENTIFIERS: frozenset = frozenset(
+    {
+        "FRIENDS",
+        "CITIZENS",
+        "UNION",
+        "STATE",
+        "TEAM",
+        "PAC",
+        "PA",
+        "GOVT",
+        "WARD",
+        "DEM",
+        "COM",
+        "COMMITTEE",
+        "CORP",
+        "ASSOCIATIONS",
+        "FOR",
+        "FOR THE",
+        "SENATE",
+        "COMMONWEALTH",
+        "ELECT",
+        "POLITICAL ACTION COMMITTEE",
+        "REPUBLICANS",
+        "REPUBLICAN",
+        "DEMOCRAT",
+        "DEMOCRATS",
+        "CORPORATION",
+        "COMPANY",
+        "CO",
+        "LIMITED",
+        "LTD",
+        "INC",
+        "INCORPORATED",
+        "LLC",
+        "FUND",
+    }
+)
 
 MI_EXPENDITURE_COLUMNS = [
     "doc_seq_no",
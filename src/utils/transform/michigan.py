@@ -281,14 +281,12 @@ class MichiganTransformer(StateTransformer):
                 merged_contribution_dataframe:
                 Merged Michigan campaign contribution dataframe cleaned in place
         """
-        merged_contribution_dataframe["cfr_com_id"] = (
-            merged_contribution_dataframe["cfr_com_id"]
-            .apply(pd.to_numeric, errors="coerce")
-            .astype("Int64")
-        )
-        merged_contribution_dataframe["amount"] = merged_contribution_dataframe[
-            "amount"
-        ].apply(pd.to_numeric, errors="coerce")
+        merged_contribution_dataframe["cfr_com_id"] = pd.to_numeric(
+            merged_contribution_dataframe["cfr_com_id"], errors="coerce"
+        ).astype("Int64")
+        merged_contribution_dataframe["amount"] = pd.to_numeric(
+            merged_contribution_dataframe["amount"], errors="coerce"
+        )
         # convert committee IDs to integer, amount and aggregate cols to float
         merged_contribution_dataframe = merged_contribution_dataframe.drop(
             columns=MI_CONT_DROP_COLS
@@ -324,24 +322,21 @@ class MichiganTransformer(StateTransformer):
                 merged_expenditure_dataframe: Merged Michigan expenditure
                 dataframe cleaned in place
         """
-        merged_expenditure_dataframe[["amount", "supp_opp"]] = (
-            merged_expenditure_dataframe[
-                ["amount", "supp_opp"]
-            ].apply(pd.to_numeric, errors="coerce")
-        )
-        merged_expenditure_dataframe["cfr_com_id"] = (
-            merged_expenditure_dataframe["cfr_com_id"]
-            .apply(pd.to_numeric, errors="coerce")
-            .astype("int64")
+        # drop unused columns before any per-column work is done on them
+        merged_expenditure_dataframe = merged_expenditure_dataframe.drop(
+            columns=MI_EXP_DROP_COLS
         )
+        # rename last_name column for consistency in standardize
         merged_expenditure_dataframe = merged_expenditure_dataframe.rename(
             columns={"lname_or_org": "l_name_or_org"}
         )
         # convert committee IDs to integer, amount col to float
-        # rename last_name column for consistency in standardize
-        merged_expenditure_dataframe = merged_expenditure_dataframe.drop(
-            columns=MI_EXP_DROP_COLS
+        merged_expenditure_dataframe["amount"] = pd.to_numeric(
+            merged_expenditure_dataframe["amount"], errors="coerce"
         )
+        merged_expenditure_dataframe["cfr_com_id"] = pd.to_numeric(
+            merged_expenditure_dataframe["cfr_com_id"], errors="coerce"
+        ).astype("int64")
         merged_expenditure_dataframe["full_name"] = (
             merged_expenditure_dataframe["f_name"].fillna("")
             + " "
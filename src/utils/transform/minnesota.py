@@ -9,6 +9,7 @@ from utils.transform.clean import StateTransformer
 from utils.transform.constants import (
     MN_CANDIDATE_CONTRIBUTION_COL,
     MN_CANDIDATE_CONTRIBUTION_MAP,
+    MN_DATE_FORMAT,
     MN_FILEPATHS_LST,
     MN_INDEPENDENT_EXPENDITURE_COL,
     MN_INDEPENDENT_EXPENDITURE_MAP,
@@ -46,9 +47,10 @@ class MinnesotaTransformer(StateTransformer):
         Returns:
             DataFrame: Preprocessed contribution df of candidate recipients
         """
-        df1 = df.copy(deep=True)
-        df1 = df1[MN_CANDIDATE_CONTRIBUTION_COL]
-        df1 = df1.rename(columns=MN_CANDIDATE_CONTRIBUTION_MAP)
+        # selecting the columns already returns a new frame, no copy needed
+        df1 = df[MN_CANDIDATE_CONTRIBUTION_COL].rename(
+            columns=MN_CANDIDATE_CONTRIBUTION_MAP
+        )
         df1["recipient_type"] = "I"
 
         none_columns = [
@@ -57,7 +59,7 @@ class MinnesotaTransformer(StateTransformer):
             "donor_last_name",
             "donor_id",
         ]
-        df1 = df1.assign(**{col: None for col in none_columns})
+        df1[none_columns] = None
 
         df1["donor_type"] = df1["donor_type"].str.upper()
         df1["state"] = "MN"
@@ -79,9 +81,9 @@ class MinnesotaTransformer(StateTransformer):
         Returns:
             DataFrame: Preprocessed contribution df of noncandidate recipients
         """
-        df1 = df.copy(deep=True)
-        df1 = df1[MN_NONCANDIDATE_CONTRIBUTION_COL]
-        df1 = df1.rename(columns=MN_NONCANDIDATE_CONTRIBUTION_MAP)
+        df1 = df[MN_NONCANDIDATE_CONTRIBUTION_COL].rename(
+            columns=MN_NONCANDIDATE_CONTRIBUTION_MAP
+        )
         none_columns = [
             "recipient_first_name",
             "recipient_last_name",
@@ -89,7 +91,7 @@ class MinnesotaTransformer(StateTransformer):
             "donor_last_name",
             "office_sought",
         ]
-        df1 = df1.assign(**{col: None for col in none_columns})
+        df1[none_columns] = None
 
         df1["donor_type"] = df1["donor_type"].str.upper()
         df1["state"] = "MN"
@@ -112,9 +114,9 @@ class MinnesotaTransformer(StateTransformer):
         Returns:
             DataFrame: Preprocessed MN expenditure DataFrames
         """
-        df1 = df.copy(deep=True)
-        df1 = df1[MN_INDEPENDENT_EXPENDITURE_COL]
-        df1 = df1.rename(columns=MN_INDEPENDENT_EXPENDITURE_MAP)
+        df1 = df[MN_INDEPENDENT_EXPENDITURE_COL].rename(
+            columns=MN_INDEPENDENT_EXPENDITURE_MAP
+        )
         # Donors and recipients are both organization, only have full name
         none_columns = [
             "recipient_first_name",
@@ -124,7 +126,7 @@ class MinnesotaTransformer(StateTransformer):
             "inkind_amount",
             "office_sought",
         ]
-        df1 = df1.assign(**{col: None for col in none_columns})
+        df1[none_columns] = None
 
         df1["recipient_id"] = df1["donor_id"].fillna(0).astype("int64")
         # Negate the contribution amount if it's against the recipient
@@ -150,13 +152,10 @@ class MinnesotaTransformer(StateTransformer):
         Returns:
             A list containing 1 preprocessed DataFrame
         """
-        candidate_dfs = []
         processed_dfs = []
         # candidate-recipient contribution data
         for filepath1 in filepaths_list[:-2]:
-            candidate = pd.read_csv(filepath1)
-            candidate_dfs.append(candidate)
-        for candidate_df in candidate_dfs:
+            candidate_df = pd.read_csv(filepath1)
             processed_cand_con = self.preprocess_candidate_contribution(candidate_df)
             processed_dfs.append(processed_cand_con)
         # noncandidate-recipient contribution data
@@ -188,8 +187,13 @@ class MinnesotaTransformer(StateTransformer):
         Returns: a list of 1 cleaned MN DataFrame
         """
         data = data[0]
-        data["date"] = pd.to_datetime(data["date"], format="mixed")
-        data["year"] = data["date"].dt.year
+        # parse with the known MN format first, only falling back to per-element
+        # format inference for the rows that do not match it
+        dates = pd.to_datetime(data["date"], format=MN_DATE_FORMAT, errors="coerce")
+        unparsed = dates.isna() & data["date"].notna()
+        if unparsed.any():
+            dates[unparsed] = pd.to_datetime(data.loc[unparsed, "date"], format="mixed")
+        data["year"] = dates.dt.year
         data = data.drop(columns=["date"])
         type_mapping = {
             "state": "str",
@@ -212,9 +216,12 @@ class MinnesotaTransformer(StateTransformer):
 
         data = data.astype(type_mapping)
         # non-classfiable rows of no transaction amount, no donor/recipient info
-        data = data[data["amount"] != 0]
-        data = data.dropna(subset=["recipient_id", "donor_id"], how="any")
-        data = data.drop(columns=["inkind_amount"])
+        classifiable = (
+            (data["amount"] != 0)
+            & data["recipient_id"].notna()
+            & data["donor_id"].notna()
+        )
+        data = data.loc[classifiable].drop(columns=["inkind_amount"])
         data = data.reset_index(drop=True)
 
         return [data]
@@ -234,74 +241,49 @@ class MinnesotaTransformer(StateTransformer):
         data = data[0].copy()  # Create a copy to avoid modifying the original DataFrame
         data["company"] = None  # MN dataset has no company information
         data["party"] = None  # MN dataset has no party information
-        data["transaction_id"] = None
+        # three uuids per row: recipient, donor, and transaction
+        new_uuids = np.array(
+            [str(uuid.uuid4()) for _ in range(3 * len(data))], dtype=object
+        ).reshape(-1, 3)
+        data["transaction_id"] = new_uuids[:, 2]
         data["office_sought"] = data["office_sought"].replace(MN_RACE_MAP)
 
         # Standardize entity names to match other states in the database schema
         entity_map = self.entity_name_dictionary
         data["recipient_type"] = data["recipient_type"].map(entity_map)
         data["donor_type"] = data["donor_type"].map(entity_map)
-        id_mapping = {}
 
-        # Standardize entity names to match othe states in database schema
-        data["recipient_type"] = data["recipient_type"].replace(
-            self.entity_name_dictionary
-        )
-        data["donor_type"] = data["donor_type"].replace(self.entity_name_dictionary)
-        id_mapping = {}
-        for index, row in data.iterrows():
-            recipient_uuid = str(uuid.uuid4())
-            donor_uuid = str(uuid.uuid4())
-            transaction_uuid = str(uuid.uuid4())
-
-            # MN has partial recipient id, generate uuid, map them to original id
-            if row["recipient_id"]:
-                if (
-                    row["recipient_type"] == "Individual"
-                    or row["recipient_type"] == "Lobbyist"
-                ):
-                    entity_type = "Individual"
-                else:
-                    entity_type = "Organization"
-                id_mapping[row["recipient_id"]] = (
-                    row["state"],
-                    row["year"],
-                    entity_type,
-                    row["recipient_id"],
-                    recipient_uuid,
-                )
-
-                data.loc[index, "recipient_id"] = recipient_uuid
-
-            # MN has partial donor id, generate uuid, map them to original id
-            if row["donor_id"]:
-                if row["donor_type"] == "Individual" or row["donor_type"] == "Lobbyist":
-                    entity_type = "Individual"
-                else:
-                    entity_type = "Organization"
-                id_mapping[row["donor_id"]] = (
-                    row["state"],
-                    row["year"],
-                    entity_type,
-                    row["donor_id"],
-                    donor_uuid,
-                )
-
-                data.loc[index, "donor_id"] = donor_uuid
-
-            data.loc[index, "transaction_id"] = transaction_uuid
-
-        # Convert id_mapping to DataFrame and save to CSV
-        id_mapping_df = pd.DataFrame.from_dict(
-            id_mapping,
-            orient="index",
-            columns=[
-                "state",
-                "year",
-                "entity_type",
-                "provided_id",
-                "database_id",
-            ],
+        # MN has partial recipient and donor ids, generate uuids for the rows
+        # that have one and map them to the original id
+        id_mapping_entries = []
+        for id_column, type_column, role_uuids in (
+            ("recipient_id", "recipient_type", new_uuids[:, 0]),
+            ("donor_id", "donor_type", new_uuids[:, 1]),
+        ):
+            has_id = data[id_column].astype(bool).to_numpy()
+            id_mapping_entries.append(
+                pd.DataFrame(
+                    {
+                        "state": data["state"],
+                        "year": data["year"],
+                        "entity_type": np.where(
+                            data[type_column].isin(["Individual", "Lobbyist"]),
+                            "Individual",
+                            "Organization",
+                        ),
+                        "provided_id": data[id_column],
+                        "database_id": role_uuids,
+                    }
+                )[has_id]
+            )
+            data.loc[has_id, id_column] = role_uuids[has_id]
+
+        # each provided id keeps the uuid of its last appearance, recipient
+        # before donor within a row
+        id_mapping_df = (
+            pd.concat(id_mapping_entries)
+            .sort_index(kind="stable")
+            .drop_duplicates(subset="provided_id", keep="last")
         )
         id_mapping_df.to_csv("MNIDMap.csv", index=False)
 
@@ -191,13 +191,9 @@ class PennsylvaniaTransformer(clean.StateTransformer):
             a pandas dataframe strictly with information regarding individuals
             from the inputted dataframe
         """
-        donor_individuals = df.loc[
-            (
-                (df.DONOR_TYPE == "Individual")
-                | (df.DONOR_TYPE == "Candidate")
-                | (df.DONOR_TYPE == "Lobbyist")
-            )
-        ][["DONOR", "DONOR_ID", "DONOR_PARTY", "DONOR_TYPE"]].rename(
+        donor_individuals = df.loc[df.DONOR_TYPE.isin(const.PA_INDIVIDUAL_TYPES)][
+            ["DONOR", "DONOR_ID", "DONOR_PARTY", "DONOR_TYPE"]
+        ].rename(
             columns={
                 "DONOR": "full_name",
                 "DONOR_ID": "id",
@@ -207,11 +203,7 @@ class PennsylvaniaTransformer(clean.StateTransformer):
         )
 
         recipient_individuals = df.loc[
-            (
-                (df.RECIPIENT_TYPE == "Individual")
-                | (df.RECIPIENT_TYPE == "Candidate")
-                | (df.RECIPIENT_TYPE == "Lobbyist")
-            )
+            df.RECIPIENT_TYPE.isin(const.PA_INDIVIDUAL_TYPES)
         ][["RECIPIENT", "RECIPIENT_ID", "RECIPIENT_PARTY", "RECIPIENT_TYPE"]].rename(
             columns={
                 "RECIPIENT": "full_name",
@@ -240,10 +232,7 @@ class PennsylvaniaTransformer(clean.StateTransformer):
             organizations from the inputted dataframe.
         """
         donor_organizations = organizations_df.loc[
-            (
-                (organizations_df.DONOR_TYPE == "Committee")
-                | (organizations_df.DONOR_TYPE == "Organization")
-            )
+            organizations_df.DONOR_TYPE.isin(const.PA_ORGANIZATION_TYPES)
         ][["DONOR_ID", "DONOR", "DONOR_TYPE"]].rename(
             columns={
                 "DONOR_ID": "id",
@@ -252,10 +241,7 @@ class PennsylvaniaTransformer(clean.StateTransformer):
             }
         )
         recipient_organizations = organizations_df.loc[
-            (
-                (organizations_df.RECIPIENT_TYPE == "Committee")
-                | (organizations_df.RECIPIENT_TYPE == "Organization")
-            )
+            organizations_df.RECIPIENT_TYPE.isin(const.PA_ORGANIZATION_TYPES)
         ]
         recipient_organizations = recipient_organizations[
             ["RECIPIENT_ID", "RECIPIENT", "RECIPIENT_TYPE"]
@@ -309,64 +295,38 @@ class PennsylvaniaTransformer(clean.StateTransformer):
             columns={"donor_office", "recipient_office"}
         )
 
+        # each type mask is computed once and shared by the 4 tables below
+        donor_is_individual = organizations_df.donor_type.isin(
+            const.PA_INDIVIDUAL_TYPES
+        )
+        donor_is_organization = organizations_df.donor_type.isin(
+            const.PA_ORGANIZATION_TYPES
+        )
+        recipient_is_individual = organizations_df.recipient_type.isin(
+            const.PA_INDIVIDUAL_TYPES
+        )
+        recipient_is_organization = organizations_df.recipient_type.isin(
+            const.PA_ORGANIZATION_TYPES
+        )
+
         # now to separate the tables into 4:
         # individuals -> individuals:
-        ind_to_ind = organizations_df.loc[
-            (
-                (
-                    (organizations_df.donor_type == "Individual")
-                    | (organizations_df.donor_type == "Candidate")
-                    | (organizations_df.donor_type == "Lobbyist")
-                )
-                & (
-                    (organizations_df.recipient_type == "Candidate")
-                    | (organizations_df.recipient_type == "Individual")
-                    | (organizations_df.recipient_type == "Lobbyist")
-                )
-            )
-        ]
+        ind_to_ind = organizations_df.loc[donor_is_individual & recipient_is_individual]
 
         # individuals -> Organizations:
         ind_to_org = organizations_df.loc[
-            (
-                (
-                    (organizations_df.donor_type == "Individual")
-                    | (organizations_df.donor_type == "Candidate")
-                    | (organizations_df.donor_type == "Lobbyist")
-                )
-                & (
-                    (organizations_df.recipient_type == "Committee")
-                    | (organizations_df.recipient_type == "Organization")
-                )
-            )
+            donor_is_individual & recipient_is_organization
         ]
 
         # Organizations -> Individuals
         org_to_ind = organizations_df.loc[
-            (
-                (
-                    (organizations_df.donor_type == "Committee")
-                    | (organizations_df.donor_type == "Organization")
-                )
-                & (
-                    (organizations_df.recipient_type == "Candidate")
-                    | (organizations_df.recipient_type == "Lobbyist")
-                )
-            )
+            donor_is_organization
+            & organizations_df.recipient_type.isin(["Candidate", "Lobbyist"])
         ]
 
         # Organizations -> Organizations:
         org_to_org = organizations_df.loc[
-            (
-                (
-                    (organizations_df.donor_type == "Committee")
-                    | (organizations_df.donor_type == "Organization")
-                )
-                & (
-                    (organizations_df.recipient_type == "Committee")
-                    | (organizations_df.recipient_type == "Organization")
-                )
-            )
+            donor_is_organization & recipient_is_organization
         ]
 
         return [ind_to_ind, ind_to_org, org_to_ind, org_to_org]
@@ -436,13 +396,9 @@ class PennsylvaniaTransformer(clean.StateTransformer):
             string "ORGANIZATION" or "INDIVIDUAL" depending on the
             classification of the parameter
         """
-        split = entity.split()
-        loc = 0
-        while loc < len(split):
-            if split[loc].upper() in const.PA_ORGANIZATION_IDENTIFIERS:
-                return "Organization"
-            loc += 1
-        return "Individual"
+        if const.PA_ORGANIZATION_IDENTIFIERS.isdisjoint(entity.upper().split()):
+            return "Individual"
+        return "Organization"
 
     def pre_process_contributor_dataset(
         self, contributor_df: pd.DataFrame
@@ -466,30 +422,7 @@ class PennsylvaniaTransformer(clean.StateTransformer):
         contributor_df["DONOR_TYPE"] = contributor_df["DONOR"].apply(
             self.classify_contributor
         )
-        contributor_df = contributor_df.drop(
-            columns={
-                "ADDRESS_1",
-                "ADDRESS_2",
-                "CITY",
-                "STATE",
-                "ZIPCODE",
-                "OCCUPATION",
-                "E_NAME",
-                "E_ADDRESS_1",
-                "E_ADDRESS_2",
-                "E_CITY",
-                "E_STATE",
-                "E_ZIPCODE",
-                "SECTION",
-                "CYCLE",
-                "CONT_DATE_1",
-                "CONT_AMT_1",
-                "CONT_DATE_2",
-                "CONT_AMT_2",
-                "CONT_DATE_3",
-                "CONT_AMT_3",
-            }
-        )
+        contributor_df = contributor_df.drop(columns=const.PA_CONT_DROP_COLS)
 
         if "TIMESTAMP" in contributor_df.columns:
             contributor_df = contributor_df.drop(columns={"TIMESTAMP", "REPORTER_ID"})
@@ -506,25 +439,7 @@ class PennsylvaniaTransformer(clean.StateTransformer):
             a pandas dataframe whose columns are appropriately formatted.
         """
         filer_df["RECIPIENT_ID"] = filer_df["RECIPIENT_ID"].astype("str")
-        filer_df = filer_df.drop(
-            columns={
-                "YEAR",
-                "CYCLE",
-                "AMEND",
-                "TERMINATE",
-                "DISTRICT",
-                "ADDRESS_1",
-                "ADDRESS_2",
-                "CITY",
-                "STATE",
-                "ZIPCODE",
-                "COUNTY",
-                "PHONE",
-                "BEGINNING",
-                "MONETARY",
-                "INKIND",
-            }
-        )
+        filer_df = filer_df.drop(columns=const.PA_FILER_DROP_COLS)
         if "TIMESTAMP" in filer_df.columns:
             filer_df = filer_df.drop(columns={"TIMESTAMP", "REPORTER_ID"})
 
@@ -545,17 +460,7 @@ class PennsylvaniaTransformer(clean.StateTransformer):
             a pandas dataframe whose columns are appropriately formatted.
         """
         expense_df["DONOR_ID"] = expense_df["DONOR_ID"].astype("str")
-        expense_df = expense_df.drop(
-            columns={
-                "EXPENSE_CYCLE",
-                "EXPENSE_ADDRESS_1",
-                "EXPENSE_ADDRESS_2",
-                "EXPENSE_CITY",
-                "EXPENSE_STATE",
-                "EXPENSE_ZIPCODE",
-                "EXPENSE_DATE",
-            }
-        )
+        expense_df = expense_df.drop(columns=const.PA_EXPENSE_DROP_COLS)
         if "EXPENSE_REPORTER_ID" in expense_df.columns:
             expense_df = expense_df.drop(
                 columns={"EXPENSE_TIMESTAMP", "EXPENSE_REPORTER_ID"}
@@ -5,6 +5,8 @@ from datetime import datetime
 
 import pandas as pd
 
+UNIX_TIMESTAMP_PATTERN = re.compile(r"/Date\((\d+)\)/")
+
 
 def convert_date(date_str: str) -> datetime.utcfromtimestamp:
     """Reformat UNIX timestamp
@@ -14,7 +16,7 @@ def convert_date(date_str: str) -> datetime.utcfromtimestamp:
     returns: reformatted date string
 
     """
-    timestamp_match = re.match(r"/Date\((\d+)\)/", date_str)
+    timestamp_match = UNIX_TIMESTAMP_PATTERN.match(date_str)
     if timestamp_match:
         timestamp = int(timestamp_match.group(1))
         return datetime.utcfromtimestamp(timestamp / 1000)
@@ -33,14 +33,15 @@ test_df = pd.DataFrame(data=d)
 test_df["classification"] = "neutral"
 
 
+# test_df is built once at import; each test gets its own copy to mutate
 @pytest.fixture
 def matcher_scen_1():
-    return test_df
+    return test_df.copy(deep=True)
 
 
 def test_matcher_scen_1(matcher_scen_1):
     apply_classification_label(matcher_scen_1, "Fancy", "address", "f")
-    res = test_df[test_df["classification"] == "f"]["name"].to_numpy()
+    res = matcher_scen_1[matcher_scen_1["classification"] == "f"]["name"].to_numpy()
 
     assert np.all(res == np.array(["bob j vonrosevich", "missy elliot", "missy eliot"]))
 
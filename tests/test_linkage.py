@@ -2,6 +2,7 @@
 
 import pandas as pd
 import pytest
+from utils import linkage
 from utils.constants import BASE_FILEPATH
 from utils.linkage import deduplicate_perfect_matches
 
@@ -10,39 +11,78 @@ Module for testing functions in linkage.py
 """
 
 
-# Test for dedupe function
-@pytest.fixture
 def return_data(filename):
     path = BASE_FILEPATH / "output" / filename
-    sample_df = pd.read_csv(path, low_memory=False)
+    if not path.exists():
+        pytest.skip(f"{filename} has not been generated in output/")
+    # every column is compared as text, so skip dtype inference entirely
+    sample_df = pd.read_csv(path, dtype=str)
     return sample_df
 
 
-@pytest.fixture
-def call_dedup_func():
-    inds_sample = return_data("complete_individuals_table.csv")
-    orgs_sample = return_data("complete_organizations_table.csv")
+# Test for dedupe function
+# the output tables are large, so each one is read once per test session
+@pytest.fixture(scope="session")
+def inds_sample():
+    return return_data("complete_individuals_table.csv")
+
+
+@pytest.fixture(scope="session")
+def orgs_sample():
+    return return_data("complete_organizations_table.csv")
+
 
-    assert not orgs_sample.empty()
-    assert not inds_sample.empty()
+@pytest.fixture(scope="session")
+def call_dedup_func(inds_sample, orgs_sample, tmp_path_factory):
+    assert not orgs_sample.empty
+    assert not inds_sample.empty
 
-    deduplicated_inds = deduplicate_perfect_matches(inds_sample)
-    deduplicated_orgs = deduplicate_perfect_matches(orgs_sample)
+    # deduplicate_perfect_matches appends to output/deduplicated_UUIDs.csv, so
+    # point it at a temporary directory instead of the tracked output/ while
+    # it runs
+    base_filepath = tmp_path_factory.mktemp("linkage")
+    (base_filepath / "output").mkdir()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(linkage, "BASE_FILEPATH", base_filepath)
+        deduplicated_inds = deduplicate_perfect_matches(inds_sample)
+        deduplicated_orgs = deduplicate_perfect_matches(orgs_sample)
 
-    output_dedup_ids = return_data("deduplicated_UUIDs.csv")
+    # only the uuid each duplicate is mapped to is checked
+    output_dedup_ids = pd.read_csv(
+        base_filepath / "output" / "deduplicated_UUIDs.csv",
+        usecols=["mapped_uuid"],
+        dtype=str,
+    )
     # outpud_ids should have all the ids that deduplicated_inds and deduplicated_orgs
     # has
 
     return deduplicated_inds, deduplicated_orgs, output_dedup_ids
 
 
-@pytest.fixture
-def confirm_dedup_uuids():
-    inds, orgs, output = call_dedup_func()
+def test_confirm_dedup_uuids(call_dedup_func):
+    inds, orgs, output = call_dedup_func
+
+    unique_ids = output.mapped_uuid.unique()
+
+    assert inds.id.isin(unique_ids).all()
+    assert orgs.id.isin(unique_ids).all()
+
+
+def test_deduplicate_perfect_matches_mapping(monkeypatch, tmp_path):
+    monkeypatch.setattr(linkage, "BASE_FILEPATH", tmp_path)
+    (tmp_path / "output").mkdir()
+    individuals = pd.DataFrame(
+        {
+            "id": ["a", "b", "c", "d"],
+            "full_name": ["Jane Doe", "Jane Doe", "John Doe", "Jane Roe"],
+            "state": ["PA", "PA", "PA", "PA"],
+        }
+    )
 
-    dedup_inds_id = set(inds.id.tolist())
-    dedup_orgs_id = set(orgs.id.tolist())
-    unique_ids = set(output.duplicated_uuids.tolist())
+    deduplicated = deduplicate_perfect_matches(individuals)
+    output = pd.read_csv(tmp_path / "output" / "deduplicated_UUIDs.csv", dtype=str)
+    mapping = dict(zip(output.original_uuids, output.mapped_uuid))
 
-    assert dedup_inds_id.issubset(unique_ids)
-    assert dedup_orgs_id.issubset(unique_ids)
+    assert sorted(deduplicated.id) == ["a", "c", "d"]
+    assert mapping == {"a": "a", "b": "a", "c": "c", "d": "d"}
+    assert deduplicated.id.isin(output.mapped_uuid).all()
@@ -0,0 +1,17 @@
+"""Tests for transform/minnesota.py"""
+
+import pandas as pd
+import pytest
+from utils.transform.constants import MN_CANDIDATE_CONTRIBUTION_COL
+from utils.transform.minnesota import MinnesotaTransformer
+
+
+def test_preprocess_rejects_malformed_rows(tmp_path):
+    candidate_file = tmp_path / "candidate.csv"
+    header = ",".join(MN_CANDIDATE_CONTRIBUTION_COL)
+    row = ",".join(["1"] * len(MN_CANDIDATE_CONTRIBUTION_COL))
+    # the second data row has one field more than the header
+    candidate_file.write_text(f"{header}\n{row}\n{row},1\n")
+
+    with pytest.raises(pd.errors.ParserError):
+        MinnesotaTransformer().preprocess([candidate_file] * 12)
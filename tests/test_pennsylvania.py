@@ -0,0 +1,37 @@
+"""Tests for transform/pennsylvania.py"""
+
+from utils.transform import constants as const
+from utils.transform.pennsylvania import PennsylvaniaTransformer
+
+
+def contributor_row(address: str) -> str:
+    values = dict.fromkeys(const.PA_CONT_COLS_NAMES_PRE2022, "")
+    values.update(
+        {
+            "RECIPIENT_ID": "1001",
+            "YEAR": "2020",
+            "DONOR": "jane doe",
+            "ADDRESS_1": address,
+            "CONT_AMT_1": "5",
+            "CONT_AMT_2": "3",
+            "CONT_AMT_3": "2",
+        }
+    )
+    return ",".join(values.values())
+
+
+def test_preprocess_skips_ragged_rows(tmp_path):
+    year_directory = tmp_path / "2020"
+    year_directory.mkdir()
+    # the unquoted comma in the second address adds an extra field
+    (year_directory / "contrib_2020.txt").write_text(
+        contributor_row("1 Main St") + "\n" + contributor_row("1 Main St, Apt 2") + "\n"
+    )
+
+    transformer = PennsylvaniaTransformer()
+    contributor_datasets, _, _ = transformer.preprocess(tmp_path)
+    contributor_df = transformer.pre_process_contributor_dataset(
+        contributor_datasets[0]
+    )
+
+    assert contributor_df["AMOUNT"].tolist() == [10]